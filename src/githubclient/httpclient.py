@@ -6,9 +6,12 @@ Author: Preocts <Preocts#8196>
 
 from __future__ import annotations
 
+import copy
+import gzip
 import json
 import logging
 import os
+import time
 from http import client
 from typing import Any
 
@@ -32,16 +35,18 @@ class HTTPClient:
         """
         self._validate_environs()
         self.headers = {
-            "Accept": "application.vnd.github.v3+json",
+            "Accept": "application/vnd.github.v3+json",
+            "Accept-Encoding": "gzip",
             "User-Agent": os.environ["GITHUB_USER_NAME"],
             "Authorization": f"token {os.environ['GITHUB_AUTH_TOKEN']}",
         }
         self.apiclient = client.HTTPSConnection(self._clean_host(host), timeout=15)
+        self._etag_cache: dict[str, tuple[str, dict[str, Any]]] = {}
 
     def _clean_host(self, host: str | None) -> str:
         """Remove the leading protocol from the host and trailing slash"""
         host = host or self.host
-        return self.host.replace("https://", "").replace("/", "")
+        return host.replace("https://", "").replace("/", "")
 
     def _validate_environs(self) -> None:
         """Check for required environment variables, raise error if missing."""
@@ -55,44 +60,107 @@ class HTTPClient:
             raise OSError(", ".join(msg))
 
     def git_get(self, endpoint: str) -> dict[str, Any]:
-        """Handles all GET requests to GitHub"""
+        """
+        Handles all GET requests to GitHub
 
-        self.apiclient.request(
-            method="GET",
-            url=endpoint,
-            headers=self.headers,
-        )
-        response = self.apiclient.getresponse()
-        status_code = response.status
-        result = response.read()
+        Responses are cached by ETag. Repeat requests send If-None-Match
+        and a 304 reply returns the cached body at no rate-limit cost.
+        """
 
-        if status_code not in range(200, 299):
-            self.logger.error("%s - %s", endpoint, result)
+        headers = self.headers
+        cached = self._etag_cache.get(endpoint)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
 
-        return self._jsonify(result)
+        status_code, response, result = self._request("GET", endpoint, headers)
+
+        if status_code == 304 and cached:
+            return copy.deepcopy(cached[1])
+
+        is_success = 200 <= status_code < 300
+        if not is_success:
+            self.logger.error("%s - %s", endpoint, result[:512])
+
+        parsed = self._jsonify(result)
+
+        etag = response.getheader("ETag")
+        if etag and is_success:
+            self._etag_cache[endpoint] = (etag, copy.deepcopy(parsed))
+
+        return parsed
 
     def git_post(self, endpoint: str, payload: dict[str, Any]) -> dict[str, Any]:
         """Handles all POST requests to GitHub, payload is translated to body"""
 
-        self.apiclient.request(
-            method="POST",
-            url=endpoint,
-            body=json.dumps(payload),
-            headers=self.headers,
-        )
-        response = self.apiclient.getresponse()
-        status_code = response.status
-        result = response.read()
+        body = json.dumps(payload, separators=(",", ":"))
+        status_code, _, result = self._request("POST", endpoint, self.headers, body)
 
-        if status_code not in range(200, 299):
-            self.logger.error("%s - %s", endpoint, result)
+        if not 200 <= status_code < 300:
+            self.logger.error("%s - %s", endpoint, result[:512])
 
         return self._jsonify(result)
 
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str],
+        body: str | None = None,
+    ) -> tuple[int, client.HTTPResponse, bytes]:
+        """Issue a request, retrying once when rate limited with a Retry-After"""
+        status_code, response, result = self._send(method, endpoint, headers, body)
+
+        delay = self._retry_delay(status_code, response)
+        if delay is not None:
+            self.logger.debug("Rate limited on %s, retry in %ds", endpoint, delay)
+            time.sleep(delay)
+            status_code, response, result = self._send(method, endpoint, headers, body)
+
+        return status_code, response, result
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str],
+        body: str | None = None,
+    ) -> tuple[int, client.HTTPResponse, bytes]:
+        """Issue a single request and read back the response body"""
+        if body is None:
+            self.apiclient.request(method=method, url=endpoint, headers=headers)
+        else:
+            self.apiclient.request(
+                method=method,
+                url=endpoint,
+                body=body,
+                headers=headers,
+            )
+        response = self.apiclient.getresponse()
+
+        return response.status, response, self._read_body(response)
+
+    @staticmethod
+    def _retry_delay(status_code: int, response: client.HTTPResponse) -> int | None:
+        """Seconds to wait before a retry, None when no retry is warranted"""
+        if status_code not in (403, 429):
+            return None
+        retry_after = response.getheader("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(int(retry_after), 60)
+        return None
+
+    @staticmethod
+    def _read_body(response: client.HTTPResponse) -> bytes:
+        """Read the response body, decompressing gzip content"""
+        body = response.read()
+        if body and response.getheader("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body
+
     @staticmethod
     def _jsonify(data: bytes) -> dict[str, Any]:
         """Translate response bytes to dict, returns key 'error' if failed"""
         try:
-            return json.loads(data.decode("utf-8"))
+            return json.loads(data)
         except json.JSONDecodeError:
             return {"error": data}
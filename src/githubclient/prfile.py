@@ -11,6 +11,7 @@ import logging
 import os
 import pathlib
 import sys
+from collections.abc import Generator
 from collections.abc import Sequence
 from configparser import ConfigParser
 from datetime import datetime
@@ -21,10 +22,6 @@ from githubclient.repoactions import RepoActions
 REPO_URL = "https://github.com/Preocts/githubclient"
 CONFIG_FILE = ".default_config.ini"
 CONFIG_SECTION = "GITHUBCLIENT"
-CWD = pathlib.Path.cwd()
-DEFAULT_NEW_BRANCH = datetime.now().strftime("%Y%m%d.%H%M%S")
-DEFAULT_TITLE = f"{DEFAULT_NEW_BRANCH} - Automated PR request"
-DEFAULT_MESSAGE = f"{DEFAULT_NEW_BRANCH} - Automated PR request"
 
 
 class PromptValues(NamedTuple):
@@ -35,6 +32,13 @@ class PromptValues(NamedTuple):
     message: str
 
 
+def default_prompt_values() -> PromptValues:
+    """Generate timestamped default branch name, title, and message"""
+    new_branch = datetime.now().strftime("%Y%m%d.%H%M%S")
+    title = f"{new_branch} - Automated PR request"
+    return PromptValues(new_branch=new_branch, title=title, message=title)
+
+
 class RepoConfig(NamedTuple):
     """Dataclass to hold config for repo actions"""
 
@@ -48,14 +52,7 @@ class RepoConfig(NamedTuple):
     def to_configparser(self) -> ConfigParser:
         """Return as ConfigParser."""
         config = ConfigParser()
-        config[CONFIG_SECTION] = {
-            "reponame": self.reponame,
-            "ownername": self.ownername,
-            "username": self.username,
-            "useremail": self.useremail,
-            "usertoken": self.usertoken,
-            "basebranch": self.basebranch,
-        }
+        config[CONFIG_SECTION] = self._asdict()
         return config
 
     @classmethod
@@ -64,17 +61,10 @@ class RepoConfig(NamedTuple):
         if CONFIG_SECTION not in configparser:
             return cls()
         section = configparser[CONFIG_SECTION]
-        return cls(
-            reponame=section.get("reponame", ""),
-            ownername=section.get("ownername", ""),
-            username=section.get("username", ""),
-            useremail=section.get("useremail", ""),
-            usertoken=section.get("usertoken", ""),
-            basebranch=section.get("basebranch", ""),
-        )
+        return cls(**{field: section.get(field, "") for field in cls._fields})
 
 
-def cli_parser(args: Sequence[str] | None = None) -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     """Configure argparse"""
     parser = argparse.ArgumentParser(
         prog="prfiles",
@@ -83,38 +73,31 @@ def cli_parser(args: Sequence[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "filenames",
-        type=str,
         nargs="*",
         help="One, or more, files to be added to the pull request (utf-8 encoding)",
     )
     parser.add_argument(
         "--reponame",
-        type=str,
         help="Set name of target repo (https://github.com/[owner name]/[repo name])",
     )
     parser.add_argument(
         "--ownername",
-        type=str,
         help="Set repo's owner name (https://github.com/[owner name]/[repo name])",
     )
     parser.add_argument(
         "--username",
-        type=str,
         help="Set your GitHub user name",
     )
     parser.add_argument(
         "--useremail",
-        type=str,
         help="Set your GitHub email for pull requests",
     )
     parser.add_argument(
         "--basebranch",
-        type=str,
         help="Set the base branch from which pull requests will be created",
     )
     parser.add_argument(
         "--usertoken",
-        type=str,
         help="Set the developer auth-token (must have 'public_repo' access)",
     )
     parser.add_argument(
@@ -129,7 +112,15 @@ def cli_parser(args: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Turns internal logging level to DEBUG.",
     )
-    return parser.parse_args() if args is None else parser.parse_args(args)
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def cli_parser(args: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments, falling back to sys.argv when args is None"""
+    return _PARSER.parse_args(args)
 
 
 def main_cli() -> None:
@@ -170,17 +161,20 @@ def get_input(prompt: str) -> str:
 
 def run_user_prompt() -> PromptValues:
     """Allow user to update values or abort"""
-    new_branch = DEFAULT_NEW_BRANCH
-    title = DEFAULT_TITLE
-    message = DEFAULT_MESSAGE
+    defaults = default_prompt_values()
+    new_branch = defaults.new_branch
+    title = defaults.title
+    message = defaults.message
     input_prompt = "set (t)itle, set (m)essage, (s)ubmit, (a)bort (t/m/s/a)? "
     uinput = ""
 
     while uinput != "s":
-        print(f"\nNew Branch: {new_branch}")
-        print(f"PR Title  : {title}")
-        print(f"PR Message: {message}")
-        print("-" * 20)
+        sys.stdout.write(
+            f"\nNew Branch: {new_branch}\n"
+            f"PR Title  : {title}\n"
+            f"PR Message: {message}\n"
+            f"{'-' * 20}\n"
+        )
         uinput = get_input(input_prompt).lower()
         if uinput == "a":
             sys.exit(1)
@@ -190,15 +184,20 @@ def run_user_prompt() -> PromptValues:
             message = get_input("Enter new message: ")
 
     return PromptValues(
-        new_branch=new_branch if new_branch else DEFAULT_NEW_BRANCH,
-        title=title if title else DEFAULT_TITLE,
-        message=message if message else DEFAULT_MESSAGE,
+        new_branch=new_branch if new_branch else defaults.new_branch,
+        title=title if title else defaults.title,
+        message=message if message else defaults.message,
     )
 
 
 def save_config(filename: str, config: RepoConfig) -> None:
-    """Save RepoConfig as ini in current working directory."""
-    RepoConfig.to_configparser(config).write(open(filename, "w"))
+    """Save RepoConfig as ini in current working directory, skip if unchanged."""
+    parser = ConfigParser()
+    if parser.read(filename) and RepoConfig.from_configparser(parser) == config:
+        return
+
+    with open(filename, "w") as config_file:
+        config.to_configparser().write(config_file)
 
 
 def load_config(filename: str, args: argparse.Namespace) -> RepoConfig:
@@ -206,33 +205,38 @@ def load_config(filename: str, args: argparse.Namespace) -> RepoConfig:
     parser = ConfigParser()
     parser.read(filename)
     config = RepoConfig.from_configparser(parser)
-    return RepoConfig(
-        reponame=config.reponame if args.reponame is None else args.reponame,
-        ownername=config.ownername if args.ownername is None else args.ownername,
-        username=config.username if args.username is None else args.username,
-        useremail=config.useremail if args.useremail is None else args.useremail,
-        usertoken=config.usertoken if args.usertoken is None else args.usertoken,
-        basebranch=config.basebranch if args.basebranch is None else args.basebranch,
-    )
+    overrides = {
+        field: value
+        for field in RepoConfig._fields
+        if (value := getattr(args, field, None)) is not None
+    }
+    return config._replace(**overrides) if overrides else config
 
 
 def fill_config(config: RepoConfig) -> RepoConfig:
     """Prompts user for missing config values"""
-    filled_config: dict[str, str] = {}
-    for key, value in config._asdict().items():
-        filled_config[key] = value if value else input(f"Enter {key}: ")
-    return RepoConfig(**filled_config)
+    if all(config):
+        return config
+
+    prompts = {
+        field: input(f"Enter {field}: ")
+        for field in RepoConfig._fields
+        if not getattr(config, field)
+    }
+    return config._replace(**prompts)
 
 
 def all_files_exist(files: list[str]) -> bool:
-    """Confirms files in list exist"""
-    return all([pathlib.Path(file).exists() for file in files]) if files else False
+    """Confirms files in list exist, stops at the first missing file"""
+    return all(os.path.isfile(file) for file in files) if files else False
 
 
 def inject_env_secrets(config: RepoConfig) -> None:
-    """Push required values to environ"""
-    os.environ["GITHUB_AUTH_TOKEN"] = config.usertoken
-    os.environ["GITHUB_USER_NAME"] = config.username
+    """Push required values to environ, skipping values already set"""
+    if os.environ.get("GITHUB_AUTH_TOKEN") != config.usertoken:
+        os.environ["GITHUB_AUTH_TOKEN"] = config.usertoken
+    if os.environ.get("GITHUB_USER_NAME") != config.username:
+        os.environ["GITHUB_USER_NAME"] = config.username
 
 
 def create_pull_request(
@@ -247,10 +251,9 @@ def create_pull_request(
 
     branch = client.create_branch(config.basebranch, prompt_values.new_branch)
 
-    blobs = [client.create_blob(content).sha for content in load_files(filenames)]
-    blob_names = [(sha, filename) for sha, filename in zip(blobs, filenames)]
+    file_contents = list(zip(load_files(filenames), filenames))
 
-    tree = client.create_blob_tree(branch.sha, blob_names)
+    tree = client.create_content_tree(branch.sha, file_contents)
 
     commit = client.create_commit(
         author_name=config.username,
@@ -273,13 +276,10 @@ def create_pull_request(
     return pull_request.html_url
 
 
-def load_files(filenames: list[str]) -> list[str]:
-    """Loads files"""
-    files: list[str] = []
-    for filename in filenames:
-        with open(filename, encoding="utf-8") as infile:
-            files.append(infile.read())
-    return files
+def load_files(filenames: list[str]) -> Generator[str, None, None]:
+    """Yields file contents one file at a time"""
+    for name in filenames:
+        yield pathlib.Path(name).read_text(encoding="utf-8")
 
 
 if __name__ == "__main__":
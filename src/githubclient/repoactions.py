@@ -6,7 +6,12 @@ Author: Preocts (Preocts#8196)
 
 from __future__ import annotations
 
+import base64
+import concurrent.futures
 import logging
+import pathlib
+import threading
+from collections.abc import Sequence
 from typing import Any
 from typing import NamedTuple
 
@@ -14,71 +19,141 @@ from githubclient.httpclient import HTTPClient
 
 
 class RepoReturn(NamedTuple):
-    """Return values from Repo actions"""
+    """Return values from Repo actions, full_return is None when unset"""
 
-    full_return: dict[str, Any] = {}
+    full_return: dict[str, Any] | None = None
     sha: str = ""
     url: str = ""
     html_url: str = ""
 
 
+_SHA_CHARS = frozenset("0123456789abcdef")
+
+
+def _is_sha(name: str) -> bool:
+    """True when name is already a full 40 character commit SHA"""
+    return len(name) == 40 and not set(name) - _SHA_CHARS
+
+
+def _dig(result: dict[str, Any], *keys: str) -> str:
+    """Pull a nested string from a result, empty string when missing"""
+    value: Any = result
+    for key in keys:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value or ""
+
+
 class RepoActions:
     """Actions for repos in GitHub"""
 
     logger = logging.getLogger(__name__)
 
-    def __init__(self, repo_owner: str, repo_name: str) -> None:
-        """Create client class. num_pools = https pool manager"""
-        self.http_client = HTTPClient()
+    def __init__(
+        self,
+        repo_owner: str,
+        repo_name: str,
+        http_client: HTTPClient | None = None,
+    ) -> None:
+        """
+        Create client class
+
+        Args:
+            repo_owner: Owner of the target repo
+            repo_name: Name of the target repo
+            http_client: Optional existing client to reuse. Sharing a
+                client across instances reuses its warm connection.
+        """
+        self.http_client = http_client or HTTPClient()
         self.repo = repo_name
         self.owner = repo_owner
+        self._repo_endpoint = f"/repos/{repo_owner}/{repo_name}"
+        self._branch_cache: dict[str, RepoReturn] = {}
+        self._thread_local = threading.local()
 
     def get_branch(self, branch_name: str) -> RepoReturn:
-        """Get a branch"""
+        """
+        Get a branch, cached per instance until the reference changes
+
+        A full 40 character SHA passed as branch_name is returned
+        directly with no API request.
+        """
         # https://docs.github.com/en/rest/reference/repos#get-a-branch
 
+        if _is_sha(branch_name):
+            return RepoReturn(sha=branch_name)
+
+        if branch_name in self._branch_cache:
+            return self._branch_cache[branch_name]
+
         self.logger.debug("Requesting SHA of branch: %s", branch_name)
-        endpoint = f"/repos/{self.owner}/{self.repo}/branches/{branch_name}"
+        endpoint = f"{self._repo_endpoint}/branches/{branch_name}"
 
         result = self.http_client.git_get(endpoint)
 
-        return RepoReturn(
+        branch = RepoReturn(
             full_return=result,
-            sha=result.get("commit", {}).get("sha", ""),
+            sha=_dig(result, "commit", "sha"),
             url=result.get("url", ""),
             html_url=result.get("html_url", ""),
         )
 
+        if branch.sha:
+            self._branch_cache[branch_name] = branch
+
+        return branch
+
     def create_branch(self, base_branch: str, new_branch: str) -> RepoReturn:
-        """Creates branch from base branch"""
+        """
+        Creates branch from base branch
+
+        When new_branch is already known (cached) to point at the base
+        branch SHA the create is skipped, avoiding a request that the
+        API would reject as an existing reference.
+        """
         # https://docs.github.com/en/rest/reference/git#create-a-reference
 
         self.logger.debug("Creating '%s' from '%s'", new_branch, base_branch)
-        endpoint = f"/repos/{self.owner}/{self.repo}/git/refs"
+        base_sha = self.get_branch(base_branch).sha
+
+        existing = self._branch_cache.get(new_branch)
+        if existing and existing.sha == base_sha:
+            return existing
+
+        endpoint = f"{self._repo_endpoint}/git/refs"
         payload = {
             "ref": f"refs/heads/{new_branch}",
-            "sha": self.get_branch(base_branch).sha,
+            "sha": base_sha,
         }
 
         result = self.http_client.git_post(endpoint, payload)
+        self._branch_cache.pop(new_branch, None)
 
         return RepoReturn(
             full_return=result,
-            sha=result.get("object", {}).get("sha", ""),
-            url=result.get("object", {}).get("url", ""),
+            sha=_dig(result, "object", "sha"),
+            url=_dig(result, "object", "url"),
         )
 
-    def create_blob(self, file_contents: str) -> RepoReturn:
-        """Creates utf-8 blob of the file_contents"""
+    def create_blob(self, file_contents: str | bytes) -> RepoReturn:
+        """
+        Creates blob of the file_contents
+
+        str content uploads as utf-8. bytes content uploads base64
+        encoded, skipping the decode/re-encode of binary files.
+        """
         # https://docs.github.com/en/rest/reference/git#create-a-blob
 
         self.logger.debug("Creating blob")
-        endpoint = f"/repos/{self.owner}/{self.repo}/git/blobs"
+        endpoint = f"{self._repo_endpoint}/git/blobs"
+        if isinstance(file_contents, bytes):
+            content = base64.b64encode(file_contents).decode("ascii")
+            encoding = "base64"
+        else:
+            content = file_contents
+            encoding = "utf-8"
         payload = {
-            "owner": self.owner,
-            "repo": self.repo,
-            "content": file_contents,
-            "encoding": "utf-8",
+            "content": content,
+            "encoding": encoding,
         }
 
         result = self.http_client.git_post(endpoint, payload)
@@ -88,6 +163,40 @@ class RepoActions:
             sha=result.get("sha", ""),
         )
 
+    def create_blob_from_path(self, path: str) -> RepoReturn:
+        """Creates blob from a file on disk, uploaded base64 encoded"""
+        # https://docs.github.com/en/rest/reference/git#create-a-blob
+
+        return self.create_blob(pathlib.Path(path).read_bytes())
+
+    def create_blobs(
+        self,
+        file_contents: Sequence[str | bytes],
+        max_connections: int = 4,
+    ) -> list[RepoReturn]:
+        """
+        Creates blobs of each file_contents, uploading concurrently
+
+        Concurrency is capped at max_connections so large batches do
+        not flood the API. Returns results in the same order as
+        file_contents.
+        """
+        # https://docs.github.com/en/rest/reference/git#create-a-blob
+
+        self.logger.debug("Creating %d blobs", len(file_contents))
+        workers = min(max_connections, len(file_contents)) or 1
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._threaded_create_blob, file_contents))
+
+    def _threaded_create_blob(self, file_contents: str | bytes) -> RepoReturn:
+        """Create a blob on a per-thread client, one connection per worker."""
+        client = getattr(self._thread_local, "client", None)
+        if client is None:
+            client = RepoActions(self.owner, self.repo)
+            self._thread_local.client = client
+        return client.create_blob(file_contents)
+
     def create_blob_tree(
         self, branch_sha: str, blob_names: list[tuple[str, str]]
     ) -> RepoReturn:
@@ -102,23 +211,61 @@ class RepoActions:
 
         self.logger.debug("Creating Tree")
 
-        endpoint = f"/repos/{self.owner}/{self.repo}/git/trees"
-        trees: list[dict[str, str]] = []
+        endpoint = f"{self._repo_endpoint}/git/trees"
+        trees = [
+            {
+                "path": file_path,
+                "mode": "100644",
+                "type": "blob",
+                "sha": blob_sha,
+            }
+            for blob_sha, file_path in blob_names
+        ]
 
-        for blob_sha, file_path in blob_names:
-            trees.append(
-                {
-                    "path": file_path,
-                    "mode": "100644",
-                    "type": "blob",
-                    "sha": blob_sha,
-                }
-            )
+        payload = {
+            "base_tree": branch_sha,
+            "tree": trees,
+        }
+
+        result = self.http_client.git_post(endpoint, payload)
+
+        return RepoReturn(
+            full_return=result,
+            sha=result.get("sha", ""),
+            url=result.get("url", ""),
+        )
+
+    def create_content_tree(
+        self, branch_sha: str, file_contents: list[tuple[str, str]]
+    ) -> RepoReturn:
+        """
+        Link file contents directly to a tree at the branch provided
+
+        Content is inlined into the tree entries so no separate blob
+        upload is needed per file. utf-8 text only; use create_blob
+        and create_blob_tree for binary files.
+
+        Args:
+            branch_sha: SHA of branch to create tree
+            file_contents: List of ([file contents], [filename])
+        """
+        # https://docs.github.com/en/rest/reference/git#create-a-tree
+
+        self.logger.debug("Creating content tree")
+
+        endpoint = f"{self._repo_endpoint}/git/trees"
+        trees = [
+            {
+                "path": file_path,
+                "mode": "100644",
+                "type": "blob",
+                "content": contents,
+            }
+            for contents, file_path in file_contents
+        ]
 
         payload = {
             "base_tree": branch_sha,
-            "owner": self.owner,
-            "repo": self.repo,
             "tree": trees,
         }
 
@@ -142,7 +289,7 @@ class RepoActions:
         # https://docs.github.com/en/rest/reference/git#create-a-commit
 
         self.logger.debug("Create commit of %s to %s", tree_sha, branch_sha)
-        endpoint = f"/repos/{self.owner}/{self.repo}/git/commits"
+        endpoint = f"{self._repo_endpoint}/git/commits"
         payload = {
             "message": message,
             "author": {
@@ -167,18 +314,19 @@ class RepoActions:
         # https://docs.github.com/en/rest/reference/git#update-a-reference
 
         self.logger.debug("Update branch %s to ref %s", branch_name, commit_sha)
-        endpoint = f"/repos/{self.owner}/{self.repo}/git/refs/heads/{branch_name}"
+        endpoint = f"{self._repo_endpoint}/git/refs/heads/{branch_name}"
         payload = {
             "ref": f"refs/heads/{branch_name}",
             "sha": commit_sha,
         }
 
         result = self.http_client.git_post(endpoint, payload)
+        self._branch_cache.pop(branch_name, None)
 
         return RepoReturn(
             full_return=result,
-            sha=result.get("object", {}).get("sha", ""),
-            url=result.get("object", {}).get("url", ""),
+            sha=_dig(result, "object", "sha"),
+            url=_dig(result, "object", "url"),
         )
 
     def create_pull_request(
@@ -193,10 +341,8 @@ class RepoActions:
         # https://docs.github.com/en/rest/reference/pulls#create-a-pull-request
 
         self.logger.debug("Create pull request of %s to %s", new_branch, base_branch)
-        endpoint = f"/repos/{self.owner}/{self.repo}/pulls"
+        endpoint = f"{self._repo_endpoint}/pulls"
         payload = {
-            "owner": self.owner,
-            "repo": self.repo,
             "title": pr_title,
             "head": new_branch,
             "base": base_branch,
@@ -215,11 +361,19 @@ class RepoActions:
         )
 
     def add_labels(self, number: str, labels: list[str]) -> RepoReturn:
-        """Add label(s) to an existing pull request"""
+        """
+        Add label(s) to an existing pull request
+
+        All labels post in a single request; one API rate-limit hit
+        regardless of how many labels are applied.
+        """
         # https://docs.github.com/en/rest/reference/issues#add-labels-to-an-issue
 
+        if not labels:
+            return RepoReturn()
+
         self.logger.debug("Add labels")
-        endpoint = f"/repos/{self.owner}/{self.repo}/issues/{number}/labels"
+        endpoint = f"{self._repo_endpoint}/issues/{number}/labels"
         payload = {
             "labels": labels,
         }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 import json
 import os
 from collections.abc import Generator
@@ -20,10 +21,11 @@ VALID_MOCK_ENV = {
 
 
 class MockValidResp:
-    def __init__(self):
+    def __init__(self, etag: str | None = None):
         self.status = 200
         self.reason = "OK"
         self.read = MagicMock(return_value=b'{"test": "response"}')
+        self.getheader = MagicMock(return_value=etag)
 
 
 class MockInvalidResp:
@@ -31,9 +33,18 @@ class MockInvalidResp:
         self.status = 400
         self.reason = "Bad Request"
         self.read = MagicMock(return_value=b"test: response")
+        self.getheader = MagicMock(return_value=None)
+
+
+class MockNotModifiedResp:
+    def __init__(self):
+        self.status = 304
+        self.reason = "Not Modified"
+        self.read = MagicMock(return_value=b"")
+        self.getheader = MagicMock(return_value=None)
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def mock_environs() -> Generator[None, None, None]:
     with patch.dict(os.environ, VALID_MOCK_ENV):
         yield None
@@ -58,6 +69,11 @@ def test_missing_env_username() -> None:
             HTTPClient()
 
 
+def test_clean_host(client: HTTPClient) -> None:
+    assert client._clean_host(None) == "api.github.com"
+    assert client._clean_host("https://github.example.com/") == "github.example.com"
+
+
 def test_jsonify() -> None:
     valid = b'{"test": "response"}'
     invalid = b"test: response"
@@ -78,6 +94,42 @@ def test_get(client: HTTPClient) -> None:
     )
 
 
+def test_get_gzip_response(client: HTTPClient) -> None:
+    resp = MockValidResp()
+    resp.read = MagicMock(return_value=gzip.compress(b'{"test": "response"}'))
+    resp.getheader = MagicMock(
+        side_effect=lambda name: "gzip" if name == "Content-Encoding" else None
+    )
+
+    with patch.object(client.apiclient, "getresponse", return_value=resp):
+        result = client.git_get("/users/Preocts")
+
+    assert result["test"] == "response"
+
+
+def test_get_etag_cached(client: HTTPClient) -> None:
+    responses = [MockValidResp(etag='W/"mock_etag"'), MockNotModifiedResp()]
+
+    with patch.object(client.apiclient, "getresponse", side_effect=responses):
+        first = client.git_get("/users/Preocts")
+        second = client.git_get("/users/Preocts")
+
+    assert first == second
+    conditional_headers = client.apiclient.request.call_args.kwargs["headers"]  # type: ignore # fixture mock
+    assert conditional_headers["If-None-Match"] == 'W/"mock_etag"'
+
+
+def test_get_etag_cache_isolated_from_mutation(client: HTTPClient) -> None:
+    responses = [MockValidResp(etag='W/"mock_etag"'), MockNotModifiedResp()]
+
+    with patch.object(client.apiclient, "getresponse", side_effect=responses):
+        first = client.git_get("/users/Preocts")
+        first["test"] = "mutated"
+        second = client.git_get("/users/Preocts")
+
+    assert second["test"] == "response"
+
+
 def test_post(client: HTTPClient) -> None:
     payload = {
         "description": "Unit test",
@@ -97,10 +149,71 @@ def test_post(client: HTTPClient) -> None:
         method="POST",
         url="/gists",
         headers=client.headers,
-        body=json.dumps(payload),
+        body=json.dumps(payload, separators=(",", ":")),
     )
 
 
+def test_post_retries_on_retry_after(client: HTTPClient) -> None:
+    limited = MockInvalidResp()
+    limited.status = 403
+    limited.getheader = MagicMock(
+        side_effect=lambda name: "0" if name == "Retry-After" else None
+    )
+    responses = [limited, MockValidResp()]
+
+    with patch.object(client.apiclient, "getresponse", side_effect=responses):
+        result = client.git_post("/gists", {"mock": "payload"})
+
+    assert result["test"] == "response"
+    assert client.apiclient.request.call_count == 2  # type: ignore # fixture mock
+
+
+def test_post_gives_up_after_one_retry(client: HTTPClient) -> None:
+    responses = [MockInvalidResp(), MockInvalidResp()]
+    for resp in responses:
+        resp.status = 403
+        resp.getheader = MagicMock(
+            side_effect=lambda name: "30" if name == "Retry-After" else None
+        )
+
+    with patch.object(client.apiclient, "getresponse", side_effect=responses):
+        with patch("time.sleep") as mock_sleep:
+            result = client.git_post("/gists", {"mock": "payload"})
+
+    assert result["error"] == b"test: response"
+    assert client.apiclient.request.call_count == 2  # type: ignore # fixture mock
+    mock_sleep.assert_called_once_with(30)
+
+
+def test_post_no_retry_without_retry_after(client: HTTPClient) -> None:
+    resp = MockInvalidResp()
+    resp.status = 403
+
+    with patch.object(client.apiclient, "getresponse", return_value=resp):
+        with patch("time.sleep") as mock_sleep:
+            result = client.git_post("/gists", {"mock": "payload"})
+
+    assert result["error"] == b"test: response"
+    client.apiclient.request.assert_called_once()  # type: ignore # fixture mock
+    mock_sleep.assert_not_called()
+
+
+def test_post_no_retry_with_non_numeric_retry_after(client: HTTPClient) -> None:
+    resp = MockInvalidResp()
+    resp.status = 429
+    resp.getheader = MagicMock(
+        side_effect=lambda name: "soon" if name == "Retry-After" else None
+    )
+
+    with patch.object(client.apiclient, "getresponse", return_value=resp):
+        with patch("time.sleep") as mock_sleep:
+            result = client.git_post("/gists", {"mock": "payload"})
+
+    assert result["error"] == b"test: response"
+    client.apiclient.request.assert_called_once()  # type: ignore # fixture mock
+    mock_sleep.assert_not_called()
+
+
 def test_get_failure(client: HTTPClient) -> None:
     with patch.object(client.apiclient, "getresponse", return_value=MockInvalidResp()):
         result = client.git_get("/users/Preocts")
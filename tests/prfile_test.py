@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import datetime
 import os
 import pathlib
 from unittest.mock import patch
@@ -11,12 +10,16 @@ import pytest
 
 from githubclient import prfile
 
-NOW = datetime.datetime.now().strftime("%H%M%S")
 TEST_INI = "tests/fixtures/repoconfig_test.ini"
 MOCK_FILES = ["filename01.txt", "filename02.txt"]
 VALID_FILES = ["./tests/prfile_test.py", "./tests/repoactions_test.py"]
 
 
+@pytest.fixture
+def mock_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("builtins.input", lambda _: "mock")
+
+
 def test_main_cli() -> None:
     """Check CLI input"""
     with patch.object(prfile, "cli_parser") as cli_parser:
@@ -28,44 +31,37 @@ def test_main_cli() -> None:
             cli_parser.assert_called_once()
 
 
-def test_main() -> None:
+def test_main(tmp_path: pathlib.Path, mock_input: None) -> None:
     """Should load dry (no config) and with empty config"""
-    filename = f"tests/fixtures/temp_{NOW}"
-
-    assert not os.path.isfile(filename)
+    filename = str(tmp_path / "config.ini")
+    missing_args = prfile.cli_parser(MOCK_FILES)
+    valid_args = prfile.cli_parser(VALID_FILES)
 
     with patch.object(prfile, "CONFIG_FILE", filename):
-        with patch("builtins.input", lambda user_in: "mock"):
-            with patch.object(prfile, "run_user_prompt"):
-                with patch.object(prfile, "RepoActions"):
-                    with pytest.raises(FileNotFoundError):
-                        prfile.main(prfile.cli_parser(MOCK_FILES))
+        with patch.object(prfile, "run_user_prompt"):
+            with patch.object(prfile, "RepoActions"):
+                with pytest.raises(FileNotFoundError):
+                    prfile.main(missing_args)
 
-                    result = prfile.main(prfile.cli_parser(VALID_FILES))
+                result = prfile.main(valid_args)
 
         assert os.path.isfile(filename)
 
-    os.remove(filename)
-
     assert result == 0
 
 
-def test_main_error() -> None:
+def test_main_error(tmp_path: pathlib.Path, mock_input: None) -> None:
     """Mock failure at GitHub process"""
-    filename = f"tests/fixtures/temp_{NOW}"
-
-    assert not os.path.isfile(filename)
+    filename = str(tmp_path / "config.ini")
+    valid_args = prfile.cli_parser(VALID_FILES)
 
     with patch.object(prfile, "CONFIG_FILE", filename):
-        with patch("builtins.input", lambda user_in: "mock"):
-            with patch.object(prfile, "run_user_prompt"):
-                with patch.object(prfile, "create_pull_request", return_value=""):
-                    result = prfile.main(prfile.cli_parser(VALID_FILES))
+        with patch.object(prfile, "run_user_prompt"):
+            with patch.object(prfile, "create_pull_request", return_value=""):
+                result = prfile.main(valid_args)
 
         assert os.path.isfile(filename)
 
-    os.remove(filename)
-
     assert result == 1
 
 
@@ -78,15 +74,26 @@ def test_parser_file_names() -> None:
         assert filename in args.filenames
 
 
-def test_create_empty_config() -> None:
+def test_create_empty_config(tmp_path: pathlib.Path) -> None:
     """Create a config file that doesn't exist"""
-    assert not pathlib.Path(NOW).exists()
+    filename = str(tmp_path / "config.ini")
+
+    prfile.save_config(filename, prfile.RepoConfig())
+
+    assert os.path.isfile(filename)
 
-    prfile.save_config(NOW, prfile.RepoConfig())
 
-    assert pathlib.Path(NOW).exists()
+def test_save_config_skips_unchanged_file(tmp_path: pathlib.Path) -> None:
+    """An on-disk config matching the given config is not rewritten"""
+    filename = str(tmp_path / "config.ini")
+    config = prfile.RepoConfig(reponame="mock")
 
-    os.remove(NOW)
+    prfile.save_config(filename, config)
+    os.utime(filename, (0, 0))
+
+    prfile.save_config(filename, config)
+
+    assert os.stat(filename).st_mtime == 0
 
 
 def test_load_config_no_cli_args() -> None:
@@ -110,18 +117,27 @@ def test_load_config_with_cli_args() -> None:
     assert result.username == "Preocts"
 
 
-def test_fill_config() -> None:
+def test_fill_config(mock_input: None) -> None:
     """Prompt for user data we are missing"""
     config = prfile.RepoConfig(reponame="Testing")
 
-    with patch("builtins.input", lambda user_in: "mock"):
+    result = prfile.fill_config(config)
+
+    for key, value in result._asdict().items():
+        if key == "reponame":
+            assert value == "Testing"
+        else:
+            assert value == "mock"
+
+
+def test_fill_config_full_skips_prompts() -> None:
+    """A fully populated config never prompts"""
+    config = prfile.RepoConfig("mock", "mock", "mock", "mock", "mock", "mock")
+
+    with patch("builtins.input", side_effect=AssertionError("prompted")):
         result = prfile.fill_config(config)
 
-        for key, value in result._asdict().items():
-            if key == "reponame":
-                assert value == "Testing"
-            else:
-                assert value == "mock"
+    assert result == config
 
 
 def test_all_files_exist() -> None:
@@ -152,13 +168,15 @@ def test_run_user_prompt() -> None:
 
 def test_run_user_prompt_defaults() -> None:
     """Blanks title and message, assert restore of defaults"""
+    defaults = prfile.PromptValues("mock_branch", "mock_title", "mock_message")
     user_inputs = ["t", "", "m", "", "s"]
 
-    with patch.object(prfile, "get_input", side_effect=user_inputs):
-        result = prfile.run_user_prompt()
+    with patch.object(prfile, "default_prompt_values", return_value=defaults):
+        with patch.object(prfile, "get_input", side_effect=user_inputs):
+            result = prfile.run_user_prompt()
 
-    assert result.message == prfile.DEFAULT_MESSAGE
-    assert result.title == prfile.DEFAULT_TITLE
+    assert result.message == defaults.message
+    assert result.title == defaults.title
 
 
 def test_run_user_prompt_abort() -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import pathlib
 from collections.abc import Generator
 from unittest.mock import patch
 
@@ -17,7 +18,7 @@ VALID_MOCK_ENV = {
 }
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def mock_environs() -> Generator[None, None, None]:
     with patch.dict(os.environ, VALID_MOCK_ENV):
         yield None
@@ -28,6 +29,12 @@ def repo() -> Generator[RepoActions, None, None]:
     yield RepoActions("mock_owner", "mock_repo")
 
 
+def test_shared_http_client(repo: RepoActions) -> None:
+    sibling = RepoActions("mock_owner", "mock_repo", repo.http_client)
+
+    assert sibling.http_client is repo.http_client
+
+
 def test_get_branch(repo: RepoActions) -> None:
     resp = {
         "commit": {
@@ -48,6 +55,47 @@ def test_get_branch(repo: RepoActions) -> None:
     assert result.full_return == resp
 
 
+def test_get_branch_cached(repo: RepoActions) -> None:
+    resp = {"commit": {"sha": "mock_sha"}}
+
+    with patch.object(repo.http_client, "git_get", return_value=resp) as mock_get:
+        repo.get_branch("mock_branch")
+        result = repo.get_branch("mock_branch")
+
+    mock_get.assert_called_once()
+    assert result.sha == "mock_sha"
+
+
+def test_get_branch_cache_invalidated_on_update(repo: RepoActions) -> None:
+    resp = {"commit": {"sha": "mock_sha"}}
+
+    with patch.object(repo.http_client, "git_get", return_value=resp) as mock_get:
+        with patch.object(repo.http_client, "git_post", return_value={}):
+            repo.get_branch("mock_branch")
+            repo.update_reference("mock_branch", "mock_new_sha")
+            repo.get_branch("mock_branch")
+
+    assert mock_get.call_count == 2
+
+
+def test_get_branch_failure_not_cached(repo: RepoActions) -> None:
+    with patch.object(repo.http_client, "git_get", return_value={}) as mock_get:
+        repo.get_branch("mock_branch")
+        repo.get_branch("mock_branch")
+
+    assert mock_get.call_count == 2
+
+
+def test_get_branch_full_sha_skips_request(repo: RepoActions) -> None:
+    sha = "a" * 40
+
+    with patch.object(repo.http_client, "git_get") as mock_get:
+        result = repo.get_branch(sha)
+
+    mock_get.assert_not_called()
+    assert result.sha == sha
+
+
 def test_create_branch(repo: RepoActions) -> None:
     mock_branch = RepoReturn(sha="mock_sha")
     resp = {
@@ -72,6 +120,19 @@ def test_create_branch(repo: RepoActions) -> None:
     assert result.url == "mock_url"
 
 
+def test_create_branch_existing_at_base_sha_skips_post(repo: RepoActions) -> None:
+    resp = {"commit": {"sha": "mock_sha"}}
+
+    with patch.object(repo.http_client, "git_get", return_value=resp):
+        existing = repo.get_branch("mock_new_branch")
+
+        with patch.object(repo.http_client, "git_post") as mock_post:
+            result = repo.create_branch("mock_branch", "mock_new_branch")
+
+    mock_post.assert_not_called()
+    assert result == existing
+
+
 def test_create_blob(repo: RepoActions) -> None:
     resp = {"sha": "mock_sha"}
     expected_url = "/repos/mock_owner/mock_repo/git/blobs"
@@ -81,8 +142,6 @@ def test_create_blob(repo: RepoActions) -> None:
     mock_post.assert_called_once_with(
         expected_url,
         {
-            "owner": "mock_owner",
-            "repo": "mock_repo",
             "content": "mock file contents",
             "encoding": "utf-8",
         },
@@ -90,6 +149,50 @@ def test_create_blob(repo: RepoActions) -> None:
     assert result.sha == "mock_sha"
 
 
+def test_create_blob_bytes(repo: RepoActions) -> None:
+    resp = {"sha": "mock_sha"}
+    expected_url = "/repos/mock_owner/mock_repo/git/blobs"
+    with patch.object(repo.http_client, "git_post", return_value=resp) as mock_post:
+        result = repo.create_blob(b"mock file contents")
+
+    mock_post.assert_called_once_with(
+        expected_url,
+        {
+            "content": "bW9jayBmaWxlIGNvbnRlbnRz",
+            "encoding": "base64",
+        },
+    )
+    assert result.sha == "mock_sha"
+
+
+def test_create_blob_from_path(repo: RepoActions) -> None:
+    expected = pathlib.Path("tests/repoactions_test.py").read_bytes()
+
+    with patch.object(repo, "create_blob") as mock_blob:
+        repo.create_blob_from_path("tests/repoactions_test.py")
+
+    mock_blob.assert_called_once_with(expected)
+
+
+def test_create_blobs(repo: RepoActions) -> None:
+    contents = ["mock contents 01", "mock contents 02"]
+
+    with patch.object(RepoActions, "create_blob") as mock_blob:
+        mock_blob.side_effect = lambda content: RepoReturn(sha=content)
+        result = repo.create_blobs(contents)
+
+    assert [blob.sha for blob in result] == contents
+
+
+def test_threaded_create_blob_reuses_client_per_thread(repo: RepoActions) -> None:
+    with patch.object(RepoActions, "create_blob"):
+        repo._threaded_create_blob("mock contents 01")
+        first_client = repo._thread_local.client
+        repo._threaded_create_blob("mock contents 02")
+
+    assert repo._thread_local.client is first_client
+
+
 def test_create_blob_tree(repo: RepoActions) -> None:
     resp = {"sha": "mock_sha", "url": "mock_url"}
     expected_url = "/repos/mock_owner/mock_repo/git/trees"
@@ -102,8 +205,6 @@ def test_create_blob_tree(repo: RepoActions) -> None:
         expected_url,
         {
             "base_tree": "mock_branch_sha",
-            "owner": "mock_owner",
-            "repo": "mock_repo",
             "tree": [
                 {
                     "path": "file.md",
@@ -118,6 +219,32 @@ def test_create_blob_tree(repo: RepoActions) -> None:
     assert result.url == "mock_url"
 
 
+def test_create_content_tree(repo: RepoActions) -> None:
+    resp = {"sha": "mock_sha", "url": "mock_url"}
+    expected_url = "/repos/mock_owner/mock_repo/git/trees"
+    with patch.object(repo.http_client, "git_post", return_value=resp) as mock_post:
+        result = repo.create_content_tree(
+            "mock_branch_sha", [("mock contents", "file.md")]
+        )
+
+    mock_post.assert_called_once_with(
+        expected_url,
+        {
+            "base_tree": "mock_branch_sha",
+            "tree": [
+                {
+                    "path": "file.md",
+                    "mode": "100644",
+                    "type": "blob",
+                    "content": "mock contents",
+                }
+            ],
+        },
+    )
+    assert result.sha == "mock_sha"
+    assert result.url == "mock_url"
+
+
 def test_create_commit(repo: RepoActions) -> None:
     resp = {"sha": "mock_sha", "url": "mock_url", "html_url": "mock_html_url"}
     expected_url = "/repos/mock_owner/mock_repo/git/commits"
@@ -172,8 +299,6 @@ def test_create_pull_request(repo: RepoActions) -> None:
     mock_post.assert_called_once_with(
         expected_url,
         {
-            "owner": "mock_owner",
-            "repo": "mock_repo",
             "title": "Auto PR",
             "head": "mock_branch",
             "base": "mock_base_branch",
@@ -197,4 +322,12 @@ def test_add_labels(repo: RepoActions) -> None:
         expected_url,
         {"labels": ["MockTest01", "MockTest02"]},
     )
-    assert len(result.full_return) == len(["MockTest01", "MockTest02"])
+    assert result.full_return == resp
+
+
+def test_add_labels_empty_skips_request(repo: RepoActions) -> None:
+    with patch.object(repo.http_client, "git_post") as mock_post:
+        result = repo.add_labels("10", [])
+
+    mock_post.assert_not_called()
+    assert result == RepoReturn()